@@ -5,16 +5,24 @@ Runs automatically on scheduled days via GitHub Actions
 Schedule: Monday, Wednesday, Friday at 8:00 AM IST (2:30 AM UTC)
 """
 
-from bs4 import BeautifulSoup
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import aiohttp
+import asyncio
+from aiolimiter import AsyncLimiter
 from tqdm import tqdm
 import pandas as pd
 import os
-from datetime import datetime, timedelta
-from openpyxl import load_workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import hashlib
 import json
+import orjson
 import logging
+import re
+import threading
 import time
 import sys
 
@@ -24,6 +32,7 @@ import sys
 
 OUTPUT_FOLDER = 'output'
 LOG_FOLDER = 'logs'
+CACHE_FOLDER = os.path.join(OUTPUT_FOLDER, '.cache', 'details')
 
 EXPORT_CONFIG = {
     'save_excel': True,
@@ -31,9 +40,33 @@ EXPORT_CONFIG = {
     'save_json': True,
 }
 
+IST = timezone(timedelta(hours=5, minutes=30))
+
 MAX_JOBS = 1000        # Safety limit - max jobs to collect
-REQUEST_DELAY = 1.0    # Seconds between requests (be polite)
+MAX_REQUESTS_PER_SECOND = 5.0  # Global request rate across all workers (be polite)
 MAX_RETRIES = 3        # Retry failed requests this many times
+DETAIL_CONCURRENCY = 10  # Max job-detail requests in flight at once
+DETAIL_CHUNK_SIZE = 50  # Job details fetched and flattened per batch
+LISTING_WORKERS = 8    # Threads fetching listing pages in parallel
+# Refetch cached job details older than this. Runs are 2, 2 and 3 days apart
+# (Mon/Wed/Fri), so entries are 2, 4/5 or 7 days old when read; 6 days sits a
+# full day away from every gap and refreshes each job about once a week.
+CACHE_MAX_AGE = timedelta(days=6)
+
+# jobPostingInfo fields kept from each job-detail response -> output column
+DETAIL_COLUMNS = {
+    'title': 'Job Title',
+    'jobDescription': 'Job Description',
+    'location': 'Location',
+    'additionalLocations': 'Additional Locations',
+    'startDate': 'Posted Date',
+    'jobReqId': 'Job ID',
+    'remoteType': 'Remote Type',
+    'externalUrl': 'Application URL',
+}
+
+# Low-cardinality output columns stored as pandas categoricals
+CATEGORY_COLUMNS = ['Remote Type', 'Location', 'Scraped Date', 'Additional Locations']
 
 # ============================================================================
 # SETUP AND UTILITY FUNCTIONS
@@ -41,7 +74,7 @@ MAX_RETRIES = 3        # Retry failed requests this many times
 
 def setup_folders():
     """Create necessary folders if they don't exist"""
-    for folder in [OUTPUT_FOLDER, LOG_FOLDER]:
+    for folder in [OUTPUT_FOLDER, LOG_FOLDER, CACHE_FOLDER]:
         os.makedirs(folder, exist_ok=True)
 
 def setup_logging():
@@ -59,32 +92,87 @@ def setup_logging():
 
 def get_timestamp():
     """Current timestamp in IST"""
-    return (datetime.utcnow() + timedelta(hours=5, minutes=30)).strftime('%Y-%m-%d_%H-%M-%S')
+    return datetime.now(IST).strftime('%Y-%m-%d_%H-%M-%S')
 
 def get_date_only():
     """Current date in IST"""
-    return (datetime.utcnow() + timedelta(hours=5, minutes=30)).strftime('%Y-%m-%d')
+    return datetime.now(IST).strftime('%Y-%m-%d')
 
-def save_run_history(status, records_count=0, error=None):
-    """Append run result to history JSON"""
-    history_file = os.path.join(LOG_FOLDER, 'run_history.json')
+def save_run_history(date_str, status, records_count=0, error=None):
+    """Append run result to history (one JSON object per line)"""
+    history_file = os.path.join(LOG_FOLDER, 'run_history.jsonl')
     entry = {
         'timestamp': get_timestamp(),
-        'date': get_date_only(),
+        'date': date_str,
         'status': status,
         'records_scraped': records_count,
         'error': str(error) if error else None
     }
-    history = []
-    if os.path.exists(history_file):
-        try:
-            with open(history_file, 'r') as f:
-                history = json.load(f)
-        except Exception:
-            history = []
-    history.append(entry)
-    with open(history_file, 'w') as f:
-        json.dump(history, f, indent=2)
+    with open(history_file, 'a') as f:
+        f.write(json.dumps(entry) + '\n')
+
+# ============================================================================
+# JOB DETAIL CACHE
+# ============================================================================
+
+def _cache_file(external_path):
+    """Cache file for one job, named by a short hash of its externalPath"""
+    digest = hashlib.blake2b(external_path.encode('utf-8')).hexdigest()[:16]
+    return os.path.join(CACHE_FOLDER, f'{digest}.json')
+
+def load_cached_details(external_path, bullet_fields):
+    """
+    Return the cached detail response for a job, or None if there is no
+    entry, it is older than CACHE_MAX_AGE, or the listing's bulletFields
+    (which carry the job ID) no longer match. Unusable entries are deleted.
+    """
+    cache_file = _cache_file(external_path)
+    try:
+        with open(cache_file, 'rb') as f:
+            entry = orjson.loads(f.read())
+    except OSError:
+        return None
+    except ValueError:
+        entry = {}
+    if (time.time() - entry.get('cached_at', 0) > CACHE_MAX_AGE.total_seconds()
+            or entry.get('externalPath') != external_path
+            or entry.get('bulletFields') != list(bullet_fields)):
+        _remove_cache_file(cache_file)
+        return None
+    return entry.get('detail')
+
+def prune_cache(paths):
+    """Delete cache files for jobs that are no longer listed"""
+    keep = {os.path.basename(_cache_file(path)) for path in paths}
+    removed = 0
+    for name in os.listdir(CACHE_FOLDER):
+        if name not in keep:
+            removed += _remove_cache_file(os.path.join(CACHE_FOLDER, name))
+    if removed:
+        logger.info(f"  Removed {removed} cached jobs that are no longer listed")
+
+def _remove_cache_file(cache_file):
+    """Delete one cache file; returns True if it was removed"""
+    try:
+        os.remove(cache_file)
+        return True
+    except OSError as e:
+        logger.warning(f"Could not remove cache file {cache_file}: {e}")
+        return False
+
+def save_cached_details(external_path, bullet_fields, detail):
+    """Store a job detail response for reuse on the next runs"""
+    entry = {
+        'externalPath': external_path,
+        'bulletFields': list(bullet_fields),
+        'cached_at': time.time(),
+        'detail': detail,
+    }
+    try:
+        with open(_cache_file(external_path), 'wb') as f:
+            f.write(orjson.dumps(entry))
+    except OSError as e:
+        logger.warning(f"Could not cache details for {external_path}: {e}")
 
 # ============================================================================
 # HTTP SESSION SETUP
@@ -127,23 +215,46 @@ def create_session():
     session = requests.Session()
     session.cookies.update(COOKIES)
     session.headers.update(HEADERS)
+    # Keep-alive pool large enough for LISTING_WORKERS threads sharing this
+    # session; transient failures are retried with backoff by the adapter
+    retry = Retry(
+        total=MAX_RETRIES,
+        backoff_factor=1.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=['GET', 'POST'],
+    )
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
     return session
 
 # ============================================================================
 # SCRAPING FUNCTIONS
 # ============================================================================
 
-def fetch_with_retry(session, method, url, retries=MAX_RETRIES, **kwargs):
-    """Make HTTP request with automatic retry on failure"""
-    for attempt in range(1, retries + 1):
-        try:
-            response = getattr(session, method)(url, timeout=30, **kwargs)
-            response.raise_for_status()
-            return response
-        except requests.exceptions.RequestException as e:
-            logger.warning(f"Attempt {attempt}/{retries} failed for {url}: {e}")
-            if attempt < retries:
-                time.sleep(2 * attempt)  # Backoff: 2s, 4s, 6s
+class RateLimiter:
+    """Thread-safe limiter: spaces calls to wait() at most `rate` per second"""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate
+        self.lock = threading.Lock()
+        self.next_slot = time.monotonic()
+
+    def wait(self):
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + self.interval
+        time.sleep(slot - now)
+
+def fetch_with_retry(session, method, url, **kwargs):
+    """Make HTTP request; retries/backoff come from the session's adapter"""
+    try:
+        response = getattr(session, method)(url, timeout=30, **kwargs)
+        response.raise_for_status()
+        return response
+    except requests.exceptions.RequestException as e:
+        logger.warning(f"Request failed for {url}: {e}")
     return None
 
 def fetch_job_list(session, offset):
@@ -158,36 +269,143 @@ def fetch_job_list(session, offset):
     response = fetch_with_retry(session, 'post', url, json=payload)
     if response:
         try:
-            return response.json()
+            return orjson.loads(response.content)
         except Exception as e:
             logger.error(f"Failed to parse job list JSON at offset {offset}: {e}")
     return {'jobPostings': []}
 
-def fetch_job_details(session, external_path):
-    """Fetch full details for a single job posting"""
+async def fetch_job_details_async(session, sem, limiter, external_path):
+    """Fetch full details for a single job posting, at most `sem` in flight"""
     url = f'https://guardianlife.wd5.myworkdayjobs.com/wday/cxs/guardianlife/Guardian-Life-Careers{external_path}'
-    response = fetch_with_retry(session, 'get', url)
-    if response:
-        try:
-            return response.json()
-        except Exception as e:
-            logger.error(f"Failed to parse job details JSON for {external_path}: {e}")
+    async with sem:
+        for attempt in range(1, MAX_RETRIES + 1):
+            try:
+                async with limiter, session.get(url) as response:
+                    response.raise_for_status()
+                    return orjson.loads(await response.read())
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.warning(f"Attempt {attempt}/{MAX_RETRIES} failed for {url}: {e}")
+                if attempt < MAX_RETRIES:
+                    await asyncio.sleep(2 * attempt)  # Backoff: 2s, 4s, 6s
+            except ValueError as e:
+                logger.error(f"Failed to parse job details JSON for {external_path}: {e}")
+                return {}
     return {}
 
+async def _gather_details(cookies, headers, paths, bullets):
+    """
+    Fetch details for paths in chunks of DETAIL_CHUNK_SIZE over one session.
+    Each finished chunk is written to the detail cache (so an interrupted run
+    resumes from there) and flattened into a small DataFrame, so raw JSON
+    never accumulates for the whole run. Returns the list of chunk frames.
+    """
+    frames = []
+    sem = asyncio.Semaphore(DETAIL_CONCURRENCY)
+    limiter = AsyncLimiter(MAX_REQUESTS_PER_SECOND, time_period=1.0)
+    connector = aiohttp.TCPConnector(limit=DETAIL_CONCURRENCY)
+    timeout = aiohttp.ClientTimeout(total=30)
+    # quote_cookie=False sends values like PLAY_SESSION unquoted, as requests does
+    cookie_jar = aiohttp.CookieJar(quote_cookie=False)
+    async with aiohttp.ClientSession(
+        connector=connector, cookie_jar=cookie_jar, cookies=cookies,
+        headers=headers, timeout=timeout
+    ) as session:
+        with tqdm(total=len(paths), desc='Fetching details') as progress:
+            for start in range(0, len(paths), DETAIL_CHUNK_SIZE):
+                chunk = paths[start:start + DETAIL_CHUNK_SIZE]
+                results = await asyncio.gather(
+                    *(fetch_job_details_async(session, sem, limiter, path) for path in chunk)
+                )
+                rows = []
+                for path, detail in zip(chunk, results):
+                    if detail:
+                        save_cached_details(path, bullets[path], detail)
+                        rows.append(flatten_job_details(path, detail))
+                if rows:
+                    frames.append(pd.DataFrame(rows))
+                progress.update(len(chunk))
+    return frames
+
+# Fast path for short, simple snippets where parser setup would dominate.
+# _TAG_RE only matches well-formed tags (quoted attribute values may contain
+# '>'), so a bare '<' (e.g. "x < 5") stays in the text. Anything it cannot
+# account for -- entities, '<!'/'<?' constructs, hidden or table elements,
+# misnested end tags, leftover tag starts -- goes to the parser instead.
+_TAG_RE = re.compile(
+    r'''<(/?)([A-Za-z][A-Za-z0-9-]*)'''
+    r'''(?:\s+[^\s"'<>/=]+(?:\s*=\s*(?:"[^"<]*"|'[^'<]*'|[^\s"'=<>`]+))?)*\s*/?>'''
+)
+_TAG_START_RE = re.compile(r'</?[A-Za-z]')
+_WS_RE = re.compile(r'\s+')
+_NEEDS_PARSER_RE = re.compile(
+    r'&|<!|<\?|</(?![A-Za-z])'
+    r'|<(?:script|style|noscript|template|table|caption|colgroup|t[rdh]|tbody|thead|tfoot)\b',
+    re.IGNORECASE
+)
+_VOID_TAGS = frozenset({
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+    'link', 'meta', 'source', 'track', 'wbr',
+})
+_FAST_PATH_MAX_LEN = 2048
+
+def _is_simple_html(html):
+    """True if tags can be stripped by regex: short, no entities/comments/hidden blocks"""
+    return len(html) < _FAST_PATH_MAX_LEN and not _NEEDS_PARSER_RE.search(html)
+
+def _tags_balanced(html):
+    """
+    True if every end tag closes the innermost open element. Stray or
+    misnested end tags change how the parser merges text, so those go
+    to the parser.
+    """
+    open_tags = []
+    for match in _TAG_RE.finditer(html):
+        name = match.group(2).lower()
+        if not match.group(1):
+            if name not in _VOID_TAGS and not match.group(0).endswith('/>'):
+                open_tags.append(name)
+        elif not open_tags or open_tags.pop() != name:
+            return False
+    return True
+
+@functools.lru_cache(maxsize=None)
+def _html_parser_class():
+    """selectolax's lexbor parser, imported on first use only"""
+    from selectolax.lexbor import LexborHTMLParser
+    return LexborHTMLParser
+
 def html_to_text(html_string):
     """Strip HTML tags and return clean plain text"""
     if not html_string or (isinstance(html_string, float) and pd.isna(html_string)):
         return ""
-    soup = BeautifulSoup(str(html_string), 'html.parser')
-    return soup.get_text(separator=' ', strip=True)
+    html_string = str(html_string)
+    if _is_simple_html(html_string) and _tags_balanced(html_string):
+        stripped = _TAG_RE.sub(' ', html_string)
+        # A tag start left over (e.g. unclosed '<b') needs the parser's rules
+        if not _TAG_START_RE.search(stripped):
+            return _WS_RE.sub(' ', stripped).strip()
+    tree = _html_parser_class()(html_string)
+    tree.strip_tags(['script', 'style', 'noscript', 'template'])  # Not visible text
+    text = tree.text(separator=' ', strip=True)
+    return ' '.join(text.split())
+
+def flatten_job_details(external_path, detail):
+    """
+    Project a job-detail response onto DETAIL_COLUMNS as one flat row,
+    already using the output column names. The rest of the response
+    (benefits, application process, ...) never reaches pandas.
+    """
+    info = detail.get('jobPostingInfo') or {}
+    row = {'_externalPath': external_path}
+    row.update({column: info.get(key) for key, column in DETAIL_COLUMNS.items()})
 
-def clean_list_field(value):
-    """Convert list fields (like additionalLocations) to a readable string"""
-    if isinstance(value, list):
-        return ', '.join(str(v) for v in value if v)
-    return value
+    # List fields become a readable string here, so no per-row apply later
+    locations = row['Additional Locations']
+    if isinstance(locations, list):
+        row['Additional Locations'] = ', '.join(str(v) for v in locations if v)
+    return row
 
-def scrape_jobs():
+def scrape_jobs(date_str):
     """
     Main scraping logic:
     1. Collect all job listing summaries (paginated)
@@ -199,19 +417,49 @@ def scrape_jobs():
 
     # --- Phase 1: Collect job listing summaries ---
     logger.info("Phase 1: Collecting job listings...")
-    all_postings = []
-
-    for offset in tqdm(range(0, MAX_JOBS, 20), desc='Fetching pages'):
-        result = fetch_job_list(session, offset)
-        postings = result.get('jobPostings', [])
-
-        if not postings:
-            logger.info(f"No more jobs found at offset {offset}. Stopping.")
-            break
 
-        all_postings.extend(postings)
-        logger.info(f"  Offset {offset}: +{len(postings)} jobs (total: {len(all_postings)})")
-        time.sleep(REQUEST_DELAY)
+    # The first page tells us how many jobs exist, so the rest can be
+    # requested in parallel instead of paging until an empty response
+    first = fetch_job_list(session, 0)
+    all_postings = list(first.get('jobPostings', []))
+    total = first.get('total')
+    logger.info(f"  Offset 0: +{len(all_postings)} jobs (reported total: {total})")
+
+    limiter = RateLimiter(MAX_REQUESTS_PER_SECOND)
+    # Only a listing known to be complete may prune the detail cache; a failed
+    # page looks the same as an empty one and would drop still-listed jobs
+    listing_complete = False
+
+    def fetch_page(offset):
+        limiter.wait()
+        return fetch_job_list(session, offset)
+
+    if all_postings and total:
+        offsets = range(20, min(total, MAX_JOBS), 20)
+        with ThreadPoolExecutor(max_workers=LISTING_WORKERS) as executor:
+            pages = list(tqdm(executor.map(fetch_page, offsets), total=len(offsets), desc='Fetching pages'))
+
+        # Every offset is below the reported total, so an empty page means the request failed
+        listing_complete = True
+        for offset, result in zip(offsets, pages):
+            postings = result.get('jobPostings', [])
+            if not postings:
+                logger.warning(f"No jobs returned at offset {offset}.")
+                listing_complete = False
+                continue
+            all_postings.extend(postings)
+            logger.info(f"  Offset {offset}: +{len(postings)} jobs (total: {len(all_postings)})")
+
+    elif all_postings:
+        # No usable total: page serially until the first empty response
+        logger.info("No total reported; paging until an empty page.")
+        for offset in tqdm(range(20, MAX_JOBS, 20), desc='Fetching pages'):
+            postings = fetch_page(offset).get('jobPostings', [])
+            if not postings:
+                logger.info(f"No more jobs found at offset {offset}. Stopping.")
+                break
+            all_postings.extend(postings)
+            logger.info(f"  Offset {offset}: +{len(postings)} jobs (total: {len(all_postings)})")
 
     if not all_postings:
         logger.warning("No job postings collected. Check if cookies are still valid.")
@@ -219,68 +467,72 @@ def scrape_jobs():
 
     logger.info(f"Total listings collected: {len(all_postings)}")
 
-    # Deduplicate by bulletFields
-    listings_df = pd.json_normalize(all_postings)
-    if 'bulletFields' in listings_df.columns:
-        listings_df = listings_df.drop_duplicates(subset=['bulletFields'])
+    # Deduplicate by externalPath so each job's details are fetched once
+    listings_df = pd.DataFrame([
+        {
+            'externalPath': posting.get('externalPath'),
+            'bulletFields': tuple(posting.get('bulletFields') or ()),
+        }
+        for posting in all_postings
+    ])
+    listings_df = listings_df.drop_duplicates(subset=['externalPath'])
     logger.info(f"After deduplication: {len(listings_df)} unique jobs")
 
     # --- Phase 2: Fetch full details for each job ---
     logger.info("Phase 2: Fetching job details...")
-    all_details = []
+    paths = list(dict.fromkeys(listings_df['externalPath']))
+    bullets = dict(zip(listings_df['externalPath'], listings_df['bulletFields']))
 
-    for path in tqdm(listings_df['externalPath'], desc='Fetching details'):
-        detail = fetch_job_details(session, path)
+    # Unchanged jobs are served from the disk cache; only the rest hit the API
+    cached_rows, missing = [], []
+    for path in paths:
+        detail = load_cached_details(path, bullets[path])
         if detail:
-            detail['_externalPath'] = path
-            all_details.append(detail)
-        time.sleep(REQUEST_DELAY)
+            cached_rows.append(flatten_job_details(path, detail))
+        else:
+            missing.append(path)
+    logger.info(f"  {len(cached_rows)} jobs cached, {len(missing)} to fetch")
+    if listing_complete:
+        prune_cache(paths)
+    else:
+        logger.info("  Listing may be incomplete; keeping cached jobs not seen this run")
+
+    frames = [pd.DataFrame(cached_rows)] if cached_rows else []
+    frames += asyncio.run(
+        _gather_details(session.cookies.get_dict(), dict(session.headers), missing, bullets)
+    )
 
-    if not all_details:
+    if not frames:
         logger.warning("No job details collected.")
         return None
 
-    details_df = pd.json_normalize(all_details)
+    details_df = pd.concat(frames, ignore_index=True)
 
     # --- Phase 3: Clean and merge ---
     logger.info("Phase 3: Merging and cleaning data...")
 
     # Clean HTML from job description
-    if 'jobPostingInfo.jobDescription' in details_df.columns:
-        details_df['jobPostingInfo.jobDescription'] = (
-            details_df['jobPostingInfo.jobDescription'].apply(html_to_text)
-        )
-
-    # Merge listings + details
-    final_df = pd.merge(
-        listings_df,
-        details_df,
-        left_on='externalPath',
-        right_on='_externalPath',
-        how='left'
+    details_df['Job Description'] = details_df['Job Description'].map(html_to_text)
+
+    # Merge listings + details: both are unique per path, so an index join
+    # avoids building a hash table for a general merge
+    final_df = (
+        listings_df.set_index('externalPath')
+        .join(details_df.set_index('_externalPath'), how='left')
+        .reset_index()
     )
 
-    # Map raw column names to human-readable names
-    column_mapping = {
-        'jobPostingInfo.title': 'Job Title',
-        'jobPostingInfo.jobDescription': 'Job Description',
-        'jobPostingInfo.location': 'Location',
-        'jobPostingInfo.additionalLocations': 'Additional Locations',
-        'jobPostingInfo.startDate': 'Posted Date',
-        'jobPostingInfo.jobReqId': 'Job ID',
-        'jobPostingInfo.remoteType': 'Remote Type',
-        'jobPostingInfo.externalUrl': 'Application URL',
-    }
-
-    available = [col for col in column_mapping if col in final_df.columns]
-    final_df = final_df[available].rename(columns=column_mapping)
-
-    # Clean list-type fields
-    if 'Additional Locations' in final_df.columns:
-        final_df['Additional Locations'] = final_df['Additional Locations'].apply(clean_list_field)
+    # Keep only the exported columns (drops externalPath / bulletFields)
+    final_df = final_df[list(DETAIL_COLUMNS.values())]
 
     # Add scrape metadata
-    final_df.insert(0, 'Scraped Date', get_date_only())
+    final_df.insert(0, 'Scraped Date', date_str)
+
+    # Compact dtypes: categoricals for repeated strings, real dates for Posted Date
+    for col in CATEGORY_COLUMNS:
+        if col in final_df.columns:
+            final_df[col] = final_df[col].astype('category')
+    final_df['Posted Date'] = pd.to_datetime(final_df['Posted Date'], errors='coerce')
 
     logger.info(f"Final dataset: {len(final_df)} jobs, {len(final_df.columns)} columns")
     return final_df
@@ -289,90 +541,108 @@ def scrape_jobs():
 # EXCEL FORMATTING
 # ============================================================================
 
-def format_excel(file_path):
-    """Apply professional formatting to the Excel output"""
-    wb = load_workbook(file_path)
-    ws = wb.active
+def write_excel(df, file_path):
+    """Write the DataFrame to a formatted Excel file in one streaming pass"""
+    import xlsxwriter
 
-    # Header style
-    header_font = Font(name='Arial', size=11, bold=True, color='FFFFFF')
-    header_fill = PatternFill(start_color='1F4E79', end_color='1F4E79', fill_type='solid')
-    header_align = Alignment(horizontal='center', vertical='center', wrap_text=True)
-
-    # Cell style
-    cell_font = Font(name='Arial', size=10)
-    cell_align = Alignment(vertical='top', wrap_text=True)
-
-    # Alternating row color
-    alt_fill = PatternFill(start_color='EBF3FB', end_color='EBF3FB', fill_type='solid')
-
-    thin = Side(style='thin', color='BDD7EE')
-    border = Border(left=thin, right=thin, top=thin, bottom=thin)
-
-    # Apply header row formatting
-    for cell in ws[1]:
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = header_align
-        cell.border = border
-
-    # Apply data row formatting
-    for row_idx, row in enumerate(ws.iter_rows(min_row=2, max_row=ws.max_row), start=2):
-        fill = alt_fill if row_idx % 2 == 0 else None
-        for cell in row:
-            cell.font = cell_font
-            cell.alignment = cell_align
-            cell.border = border
-            if fill:
-                cell.fill = fill
+    # constant_memory flushes each row as soon as the next one starts, so rows
+    # must be written in order (df.to_excel writes column by column)
+    wb = xlsxwriter.Workbook(file_path, {
+        'constant_memory': True,
+        'strings_to_formulas': False,
+        'strings_to_urls': False,
+        'strings_to_numbers': False,
+    })
+    ws = wb.add_worksheet('Sheet1')
 
-    # Column widths (adjust as needed)
-    col_widths = {
-        'A': 14,  # Scraped Date
-        'B': 38,  # Job Title
-        'C': 65,  # Job Description
-        'D': 22,  # Location
-        'E': 22,  # Additional Locations
-        'F': 14,  # Posted Date
-        'G': 16,  # Job ID
-        'H': 16,  # Remote Type
-        'I': 55,  # Application URL
-    }
-    for col, width in col_widths.items():
-        ws.column_dimensions[col].width = width
+    border = {'border': 1, 'border_color': '#BDD7EE'}
 
-    ws.freeze_panes = 'A2'
-    ws.row_dimensions[1].height = 32
-    ws.auto_filter.ref = ws.dimensions
+    # Header style
+    header_fmt = wb.add_format({
+        **border, 'font_name': 'Arial', 'font_size': 11, 'bold': True,
+        'font_color': '#FFFFFF', 'bg_color': '#1F4E79',
+        'align': 'center', 'valign': 'vcenter', 'text_wrap': True,
+    })
+
+    # Cell style, plus alternating row color; each with a date variant
+    cell = {**border, 'font_name': 'Arial', 'font_size': 10, 'valign': 'top', 'text_wrap': True}
+    alt = {**cell, 'bg_color': '#EBF3FB'}
+    row_formats = [
+        (wb.add_format(cell), wb.add_format({**cell, 'num_format': 'yyyy-mm-dd'})),
+        (wb.add_format(alt), wb.add_format({**alt, 'num_format': 'yyyy-mm-dd'})),
+    ]
 
-    wb.save(file_path)
+    # Column widths (adjust as needed)
+    col_widths = [
+        14,  # Scraped Date
+        38,  # Job Title
+        65,  # Job Description
+        22,  # Location
+        22,  # Additional Locations
+        14,  # Posted Date
+        16,  # Job ID
+        16,  # Remote Type
+        55,  # Application URL
+    ]
+    for col, width in enumerate(col_widths):
+        ws.set_column(col, col, width)
+
+    ws.freeze_panes(1, 0)
+    ws.set_row(0, 32)
+    ws.write_row(0, 0, list(df.columns), header_fmt)
+
+    # Data rows: Excel row 2 (index 1) is the first shaded one
+    for row_idx, row in enumerate(df.itertuples(index=False, name=None), start=1):
+        text_fmt, date_fmt = row_formats[row_idx % 2]
+        for col_idx, value in enumerate(row):
+            if pd.isna(value):
+                ws.write_blank(row_idx, col_idx, None, text_fmt)
+            elif isinstance(value, datetime):
+                ws.write_datetime(row_idx, col_idx, value, date_fmt)
+            else:
+                ws.write(row_idx, col_idx, value, text_fmt)
+
+    ws.autofilter(0, 0, len(df), len(df.columns) - 1)
+    wb.close()
     logger.info(f"Excel formatting applied: {file_path}")
 
 # ============================================================================
 # EXPORT FUNCTIONS
 # ============================================================================
 
-def export_data(df):
+def export_data(df, date_str):
     """Save DataFrame to configured file formats"""
-    date_str = get_date_only()
     exported = []
 
+    # Text formats keep Posted Date as a plain YYYY-MM-DD string
+    text_df = df
+    if 'Posted Date' in df.columns and pd.api.types.is_datetime64_any_dtype(df['Posted Date']):
+        text_df = df.assign(**{'Posted Date': df['Posted Date'].dt.strftime('%Y-%m-%d')})
+
     if EXPORT_CONFIG['save_excel']:
         path = os.path.join(OUTPUT_FOLDER, f'GuardianLife_Jobs_{date_str}.xlsx')
-        df.to_excel(path, index=False, engine='openpyxl')
-        format_excel(path)
+        write_excel(df, path)
         exported.append(path)
         logger.info(f"Excel saved: {os.path.basename(path)}")
 
     if EXPORT_CONFIG['save_csv']:
         path = os.path.join(OUTPUT_FOLDER, f'GuardianLife_Jobs_{date_str}.csv')
-        df.to_csv(path, index=False, encoding='utf-8-sig')
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+
+        table = pa.Table.from_pandas(text_df, preserve_index=False)
+        with open(path, 'wb') as f:
+            f.write(b'\xef\xbb\xbf')  # UTF-8 BOM so Excel detects the encoding
+            pacsv.write_csv(table, f, write_options=pacsv.WriteOptions(
+                include_header=True, quoting_style='needed'
+            ))
         exported.append(path)
         logger.info(f"CSV saved: {os.path.basename(path)}")
 
     if EXPORT_CONFIG['save_json']:
         path = os.path.join(OUTPUT_FOLDER, f'GuardianLife_Jobs_{date_str}.json')
-        df.to_json(path, orient='records', indent=2, force_ascii=False)
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(text_df.to_dict('records'), option=orjson.OPT_INDENT_2))
         exported.append(path)
         logger.info(f"JSON saved: {os.path.basename(path)}")
 
@@ -387,6 +657,7 @@ def main():
 
     setup_folders()
     logger = setup_logging()
+    run_date = get_date_only()  # Fixed for the whole run
 
     logger.info("=" * 70)
     logger.info("Guardian Life Career Scraper — GitHub Actions Auto Run")
@@ -394,16 +665,16 @@ def main():
     logger.info("=" * 70)
 
     try:
-        df = scrape_jobs()
+        df = scrape_jobs(run_date)
 
         if df is None or df.empty:
             logger.warning("No data scraped. Verify cookies are still valid.")
-            save_run_history('no_data')
+            save_run_history(run_date, 'no_data')
             print("\n⚠️  No jobs found — cookies may have expired.")
             sys.exit(1)
 
-        exported_files = export_data(df)
-        save_run_history('success', len(df))
+        exported_files = export_data(df, run_date)
+        save_run_history(run_date, 'success', len(df))
 
         logger.info("=" * 70)
         logger.info(f"✅ Scraping completed successfully!")
@@ -424,7 +695,7 @@ def main():
 
     except Exception as e:
         logger.error(f"Fatal error: {e}", exc_info=True)
-        save_run_history('error', error=e)
+        save_run_history(run_date, 'error', error=e)
         print(f"\n❌ Error: {e}")
         sys.exit(1)
 